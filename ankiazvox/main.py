@@ -1,51 +1,173 @@
 import os
-import base64
+import re
+import html
 import time
-import shutil
 import yaml
 import subprocess
 import random
-from typing import Any, Optional, Dict, List, Tuple
+import operator
+import io
+import uuid
+import zipfile
+import hashlib
+import sqlite3
+import tempfile
+import threading
+from typing import Any, Optional, Dict, Iterator, List, Tuple
 from pathlib import Path
 from dotenv import load_dotenv
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import azure.cognitiveservices.speech as speechsdk
 from tqdm import tqdm
 import click
 from bs4 import BeautifulSoup
 
+try:
+    # SIMD-accelerated, and encodes straight to str without an intermediate bytes copy
+    from pybase64 import b64encode_as_string
+except ImportError:
+    from base64 import b64encode
+
+    def b64encode_as_string(data: bytes) -> str:
+        return b64encode(data).decode("ascii")
+
 # --- Constants ---
 DEFAULT_CONFIG_FILENAME = "azv_config.yaml"
 MAX_RETRIES = 5
+DEFAULT_WORKERS = 8
+ANKI_BATCH_SIZE = 32
+NOTES_INFO_CHUNK_SIZE = 256
+BATCH_API_VERSION = "2024-04-01"
+BATCH_MIN_TASKS = 200
+BATCH_MAX_INPUTS = 1000
+BATCH_POLL_INTERVAL = 10
+BATCH_JOB_TIMEOUT = 3600  # seconds to wait for one batch job before giving up
+CACHE_DIR = Path.home() / ".cache" / "ankiazvox"
+CACHE_TTL_DAYS = 90
+ANKI_TIMEOUT = (3, 30)  # (connect, read) seconds
+ANKI_BREAKER_THRESHOLD = 5  # consecutive failed calls (each already retried) abort the run
+ANKI_BREAKER_WINDOW = 30  # seconds without failures before the count starts over
+
+# Matches real tags only, so text like "1 < 2" is left alone
+_TAG_RE = re.compile(r"</?[A-Za-z][^>]*>")
+_BR_RE = re.compile(r"<br\b[^>]*>", re.IGNORECASE)
+_COMPLEX_HTML_RE = re.compile(r"<(?:script|style|!--)", re.IGNORECASE)
+_STRIP_SCRIPT_TAGS = ("script", "style")
+_PARTIAL_MARKUP_TAIL_RE = re.compile(r"&[^;\s]*$|<[^>]*$")
+FAST_CLEAN_MAX_LEN = 2048
+HTML_PARSER = "lxml"  # C-based tree builder; lxml is a required dependency
+# Redraw progress bars at most twice a second; large syncs complete thousands of items
+PROGRESS_OPTIONS = {"mininterval": 0.5, "smoothing": 0.1}
+MAX_TTS_CHARS = 5000  # Azure bills per character; longer fields are usually pasted by mistake
 
 # --- Core Logic Classes ---
 
+class AnkiConnectionError(Exception):
+    """Raised when AnkiConnect keeps failing and further calls are pointless."""
+
+
 class AnkiClient:
     """Wrapper for AnkiConnect API interactions."""
     
-    def __init__(self, url: str):
+    def __init__(self, url: str, pool_size: int = DEFAULT_WORKERS):
         self.url = url
         self.version = 6
+        # Reuse one keep-alive connection pool instead of reconnecting per call
+        self.session = requests.Session()
+        self.session.headers.update({"Connection": "keep-alive", "Content-Type": "application/json"})
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=max(pool_size, 1),
+            # Every action we send is safe to repeat, so POSTs may be retried too
+            max_retries=Retry(
+                total=5,
+                backoff_factor=0.3,
+                status_forcelist=[502, 503, 504],
+                allowed_methods=frozenset({"POST"}),
+            ),
+        )
+        self.session.mount(url, adapter)
+        # Circuit breaker state, shared with the notesInfo prefetch thread
+        self._breaker_lock = threading.Lock()
+        self._failures = 0
+        self._last_failure_at = 0.0
+
+    def _check_breaker(self):
+        """Raise if recent calls have failed too often to keep trying."""
+        with self._breaker_lock:
+            if self._failures < ANKI_BREAKER_THRESHOLD:
+                return
+            if time.monotonic() - self._last_failure_at > ANKI_BREAKER_WINDOW:
+                # No failures for a while; give the connection another chance
+                self._failures = 0
+                return
+            raise AnkiConnectionError(
+                f"AnkiConnect failed {self._failures} times in a row; is Anki running at {self.url}?"
+            )
+
+    def _record_failure(self):
+        with self._breaker_lock:
+            if time.monotonic() - self._last_failure_at > ANKI_BREAKER_WINDOW:
+                self._failures = 0
+            self._last_failure_at = time.monotonic()
+            self._failures += 1
+
+    def _record_success(self):
+        with self._breaker_lock:
+            self._failures = 0
 
     def invoke(self, action: str, **params) -> Any:
-        """Standard method to invoke AnkiConnect actions."""
+        """Standard method to invoke AnkiConnect actions.
+
+        Returns None on failure; raises AnkiConnectionError once the circuit breaker trips.
+        """
+        self._check_breaker()
         payload = {"action": action, "version": self.version, "params": params}
         try:
-            response = requests.post(self.url, json=payload)
+            # orjson is much faster than stdlib json on the large base64 media payloads
+            response = self.session.post(self.url, data=orjson.dumps(payload), timeout=ANKI_TIMEOUT)
             response.raise_for_status()
-            data = response.json()
+        except requests.RequestException as e:
+            self._record_failure()
+            click.secho(
+                f"Error: Unable to connect to Anki. ({e})",
+                fg="red",
+            )
+            self._check_breaker()
+            return None
+        self._record_success()
+        try:
+            data = orjson.loads(response.content)
             if data.get("error"):
                 raise Exception(f"AnkiConnect Error: {data['error']}")
             return data.get("result")
         except Exception as e:
             click.secho(
-                f"Error: Unable to connect to Anki. ({e})",
+                f"Error: AnkiConnect '{action}' request failed. ({e})",
                 fg="red",
             )
             return None
 
+    def invoke_multi(self, actions: List[Dict[str, Any]]) -> List[Optional[str]]:
+        """Run several actions in a single request via AnkiConnect's 'multi' action.
+
+        Returns one entry per action: None on success, otherwise the error message.
+        """
+        versioned = [{**a, "version": self.version} for a in actions]
+        results = self.invoke("multi", actions=versioned)
+        if results is None:
+            return ["request failed"] * len(actions)
+        return [r.get("error") if isinstance(r, dict) else None for r in results]
+
+    def close(self):
+        """Release pooled connections."""
+        self.session.close()
+
 
 class AzureTTSManager:
     """Wrapper for Azure Cognitive Services Speech Synthesis with SSML support."""
@@ -54,6 +176,7 @@ class AzureTTSManager:
         self.key = key
         self.region = region
         self.voice = voice
+        self._local = threading.local()
 
     def _get_config(self) -> speechsdk.SpeechConfig:
         """Create fresh config for thread safety."""
@@ -65,17 +188,31 @@ class AzureTTSManager:
         )
         return config
 
-    def speak(self, content: str, save_path: Path, debug: bool = False) -> bool:
-        """Synthesize content with exponential backoff for rate limits."""
-        config = self._get_config()
-        audio_config = speechsdk.audio.AudioOutputConfig(filename=str(save_path))
-        
+    def _get_synthesizer(self) -> speechsdk.SpeechSynthesizer:
+        """Return this thread's synthesizer for the current voice, creating it on first use.
+
+        Reusing the synthesizer keeps its connection to Azure warm across calls.
+        """
+        synthesizer = getattr(self._local, "synthesizer", None)
+        # Only one synthesizer is kept per thread; a voice change replaces it
+        if synthesizer is None or self._local.voice != self.voice:
+            synthesizer = speechsdk.SpeechSynthesizer(speech_config=self._get_config(), audio_config=None)
+            self._local.synthesizer = synthesizer
+            self._local.voice = self.voice
+        return synthesizer
+
+    def _discard_synthesizer(self):
+        """Drop this thread's synthesizer so the next call reconnects."""
+        self._local.synthesizer = None
+
+    def synthesize(self, content: str, debug: bool = False) -> Optional[bytes]:
+        """Synthesize content to MP3 bytes with exponential backoff for rate limits."""
+        is_ssml = content.strip().startswith("<speak")
+
         for attempt in range(MAX_RETRIES):
-            synthesizer = speechsdk.SpeechSynthesizer(
-                speech_config=config, audio_config=audio_config
-            )
-            
-            if content.strip().startswith("<speak"):
+            synthesizer = self._get_synthesizer()
+
+            if is_ssml:
                 result = synthesizer.speak_ssml_async(content).get()
                 
             else:
@@ -86,8 +223,8 @@ class AzureTTSManager:
                 
             if result.reason == speechsdk.ResultReason.SynthesizingAudioCompleted:
                 if debug:
-                    click.secho(f"[DEBUG] Audio synthesis successful, saved to {save_path}", fg="green")
-                return True
+                    click.secho(f"[DEBUG] Audio synthesis successful, {len(result.audio_data)} bytes", fg="green")
+                return result.audio_data
             
             # Handle Throttling (429)
             if result.reason == speechsdk.ResultReason.Canceled:
@@ -100,9 +237,92 @@ class AzureTTSManager:
                         click.secho(f"[DEBUG] Rate limited (429), retrying in {wait:.2f}s (attempt {attempt + 1}/{MAX_RETRIES})", fg="yellow")
                     time.sleep(wait)
                     continue
+                # Don't keep a synthesizer whose connection may be broken
+                self._discard_synthesizer()
             
+            return None
+        return None
+
+    def speak(self, content: str, save_path: Path, debug: bool = False) -> bool:
+        """Synthesize content and save it as an MP3 file."""
+        audio = self.synthesize(content, debug=debug)
+        if audio is None:
             return False
-        return False
+        with open(save_path, "wb") as f:
+            f.write(audio)
+        return True
+
+    def synthesize_batch(self, ssml_docs: List[str], debug: bool = False) -> List[Optional[bytes]]:
+        """Synthesize many SSML documents with the Azure Batch Synthesis REST API.
+
+        Returns MP3 bytes per document, in input order; None where synthesis failed.
+        """
+        results: List[Optional[bytes]] = []
+        for start in range(0, len(ssml_docs), BATCH_MAX_INPUTS):
+            chunk = ssml_docs[start:start + BATCH_MAX_INPUTS]
+            try:
+                results.extend(self._run_batch_job(chunk, debug=debug))
+            except Exception as e:
+                click.secho(f"Error: Azure batch synthesis failed. ({e})", fg="red")
+                results.extend([None] * len(chunk))
+        return results
+
+    def _run_batch_job(self, ssml_docs: List[str], debug: bool = False) -> List[Optional[bytes]]:
+        """Submit one batch synthesis job, wait for it and unpack the resulting MP3s."""
+        job_url = f"https://{self.region}.api.cognitive.microsoft.com/texttospeech/batchsyntheses/azv-{uuid.uuid4().hex}"
+        params = {"api-version": BATCH_API_VERSION}
+        body = {
+            "inputKind": "SSML",
+            "inputs": [{"content": doc} for doc in ssml_docs],
+            "properties": {
+                "outputFormat": "audio-16khz-32kbitrate-mono-mp3",
+                "concatenateResult": False,
+                "timeToLiveInHours": 24,
+            },
+        }
+        with requests.Session() as session:
+            session.headers.update({"Ocp-Apim-Subscription-Key": self.key})
+            response = session.put(job_url, params=params, json=body, timeout=60)
+            response.raise_for_status()
+            if debug:
+                click.secho(f"[DEBUG] Submitted batch job with {len(ssml_docs)} inputs: {job_url}", fg="cyan")
+
+            try:
+                deadline = time.monotonic() + BATCH_JOB_TIMEOUT
+                while True:
+                    response = session.get(job_url, params=params, timeout=30)
+                    response.raise_for_status()
+                    job = response.json()
+                    status = job.get("status")
+                    if status == "Succeeded":
+                        break
+                    if status == "Failed":
+                        raise RuntimeError(job.get("properties", {}).get("error", {}).get("message", "job failed"))
+                    if status not in ("NotStarted", "Running"):
+                        raise RuntimeError(f"unexpected batch job status: {status!r}")
+                    if time.monotonic() > deadline:
+                        raise TimeoutError(f"batch job still {status} after {BATCH_JOB_TIMEOUT}s")
+                    if debug:
+                        click.secho(f"[DEBUG] Batch job status: {status}", fg="cyan")
+                    time.sleep(BATCH_POLL_INTERVAL)
+
+                # The result URL carries its own SAS token, so fetch it without the subscription key
+                archive_response = requests.get(job["outputs"]["result"], timeout=300)
+                archive_response.raise_for_status()
+            finally:
+                # Best-effort cleanup; the job also expires on its own after timeToLiveInHours
+                try:
+                    session.delete(job_url, params=params, timeout=30)
+                except requests.RequestException:
+                    pass
+
+        # Outputs are named 0001.mp3, 0002.mp3, ... in input order
+        with zipfile.ZipFile(io.BytesIO(archive_response.content)) as archive:
+            names = set(archive.namelist())
+            return [
+                archive.read(f"{i:04d}.mp3") if f"{i:04d}.mp3" in names else None
+                for i in range(1, len(ssml_docs) + 1)
+            ]
 
     def get_voice_list(self, locale: Optional[str] = None) -> List[Any]:
         """Fetch list of available voices from Azure."""
@@ -110,18 +330,106 @@ class AzureTTSManager:
         synthesizer = speechsdk.SpeechSynthesizer(speech_config=config, audio_config=None)
         result = synthesizer.get_voices_async(locale if locale else "").get()
         if result.reason == speechsdk.ResultReason.VoicesListRetrieved:
-            return sorted(result.voices, key=lambda x: x.short_name)
+            return sorted(result.voices, key=operator.attrgetter("short_name"))
         return []
 
     def list_voices(self, locale: Optional[str] = None):
         """Display available voices in terminal."""
         voices = self.get_voice_list(locale)
         if voices:
-            click.echo(f"{'Voice Name':<40} | {'Gender':<10} | {'Locale':<10}")
-            click.echo("-" * 65)
-            for v in voices:
-                gender = "Female" if v.gender == speechsdk.SynthesisVoiceGender.Female else "Male"
-                click.echo(f"{v.short_name:<40} | {gender:<10} | {v.locale:<10}")
+            female = speechsdk.SynthesisVoiceGender.Female
+            rows = [f"{'Voice Name':<40} | {'Gender':<10} | {'Locale':<10}", "-" * 65]
+            rows += [
+                f"{v.short_name:<40} | {'Female' if v.gender == female else 'Male':<10} | {v.locale:<10}"
+                for v in voices
+            ]
+            # One write instead of one per voice
+            click.echo("\n".join(rows))
+
+
+class AudioCache:
+    """Persistent cache of synthesized MP3s keyed by voice and content.
+
+    Audio is stored as <key>.mp3 files, indexed by a SQLite database in WAL mode.
+    """
+
+    def __init__(self, cache_dir: Path = CACHE_DIR, ttl_days: int = CACHE_TTL_DAYS):
+        self.cache_dir = cache_dir
+        self.ttl = ttl_days * 86400
+        self._lock = threading.Lock()
+        self._write_failed = False
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # Shared by the worker threads; access is serialized by self._lock
+        self._db = sqlite3.connect(cache_dir / "index.db", isolation_level=None, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS entries("
+            "key TEXT PRIMARY KEY, voice TEXT, created_at INTEGER, size INTEGER)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS entries_created_at ON entries(created_at)")
+
+    @staticmethod
+    def key(voice: str, content: str) -> str:
+        return hashlib.blake2b(f"{voice}|{content}".encode("utf-8"), digest_size=16).hexdigest()
+
+    def path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.mp3"
+
+    def get(self, voice: str, content: str) -> Optional[bytes]:
+        """Return cached MP3 bytes, or None on a cache miss."""
+        key = self.key(voice, content)
+        with self._lock:
+            row = self._db.execute("SELECT 1 FROM entries WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        try:
+            return self.path(key).read_bytes()
+        except FileNotFoundError:
+            with self._lock:
+                self._db.execute("DELETE FROM entries WHERE key = ?", (key,))
+            return None
+
+    def put(self, voice: str, content: str, audio: bytes):
+        """Store freshly synthesized MP3 bytes in the cache.
+
+        Failures are reported once and otherwise ignored; the caller keeps its audio either way.
+        """
+        key = self.key(voice, content)
+        try:
+            # Write-then-rename so a concurrent get never sees a partially written file
+            fd, tmp_name = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(audio)
+                os.replace(tmp_name, self.path(key))
+            except BaseException:
+                Path(tmp_name).unlink(missing_ok=True)
+                raise
+            with self._lock:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO entries(key, voice, created_at, size) VALUES (?, ?, ?, ?)",
+                    (key, voice, int(time.time()), len(audio)),
+                )
+        except (OSError, sqlite3.Error) as e:
+            with self._lock:
+                if self._write_failed:
+                    return
+                self._write_failed = True
+            click.secho(f"Warning: Could not write to audio cache, new audio will not be cached. ({e})", fg="yellow")
+
+    def evict_expired(self) -> int:
+        """Remove entries older than the TTL. Returns the number evicted."""
+        cutoff = int(time.time()) - self.ttl
+        with self._lock:
+            expired = [k for (k,) in self._db.execute("SELECT key FROM entries WHERE created_at < ?", (cutoff,))]
+            self._db.execute("DELETE FROM entries WHERE created_at < ?", (cutoff,))
+        for key in expired:
+            self.path(key).unlink(missing_ok=True)
+        return len(expired)
+
+    def close(self):
+        self._db.close()
 
 
 # --- Utilities ---
@@ -150,12 +458,34 @@ def wrap_ssml(text: str, voice: str, rate: str = "1.0", pitch: str = "0%") -> st
 def clean_html(raw_html: str) -> str:
     """Remove HTML tags except <br> and convert entities to plain text for TTS processing."""
     if not raw_html: return ""
-    soup = BeautifulSoup(raw_html, "html.parser")
+    # Plain text needs no work at all
+    if "<" not in raw_html and ">" not in raw_html and "&" not in raw_html: return raw_html
+    # Typical Anki fields are tiny fragments; a regex pass is much cheaper than building a tree
+    if len(raw_html) < FAST_CLEAN_MAX_LEN and not _COMPLEX_HTML_RE.search(raw_html):
+        return "<br/>".join(
+            html.escape(html.unescape(_TAG_RE.sub("", part)), quote=False)
+            for part in _BR_RE.split(raw_html)
+        )
+    soup = BeautifulSoup(raw_html, HTML_PARSER)
+    for tag in soup(_STRIP_SCRIPT_TAGS):
+        tag.decompose()
     for tag in soup.find_all(True):
         if tag.name != 'br':
             tag.unwrap()
     return str(soup)
 
+def has_speakable_text(raw_html: str) -> bool:
+    """Cheap check that a field has something to read once tags and whitespace are ignored."""
+    if not raw_html or raw_html.isspace():
+        return False
+    return bool(html.unescape(_TAG_RE.sub("", raw_html)).strip())
+
+def truncate_for_tts(txt: str, limit: int = MAX_TTS_CHARS) -> str:
+    """Cut cleaned text to limit characters without leaving a partial entity or <br/> at the end."""
+    if len(txt) <= limit:
+        return txt
+    return _PARTIAL_MARKUP_TAIL_RE.sub("", txt[:limit])
+
 def load_config(config_path: Optional[str] = None) -> Dict[str, str]:
     """Load configuration from YAML or .env file."""
     config = {
@@ -203,42 +533,171 @@ def parse_field_mapping(mapping_str: str) -> Dict[str, str]:
             mapping[s.strip()] = t.strip()
     return mapping
 
-def process_single_task(task: Tuple, tts: AzureTTSManager, anki: AnkiClient, 
-                        temp_path: Path, voice: str, rate: str, pitch: str, ssml_source: bool = False, debug: bool = False) -> bool:
-    """Worker function for threading."""
-    nid, s_fld, t_fld, txt = task
+def build_missing_audio_query(query: str, target_fields: List[str]) -> str:
+    """Narrow an Anki search to notes where at least one target field is empty.
+
+    Anki treats a field holding only whitespace as non-empty, so such notes are excluded.
+    """
+    # Backslash-escape the characters Anki's search syntax treats specially in field names
+    terms = ['"' + re.sub(r'([\\"*_:])', r"\\\1", field) + ':"' for field in target_fields]
+    return f"({query}) ({' OR '.join(terms)})"
+
+def iter_notes_info(anki: AnkiClient, note_ids: List[int], chunk_size: int = NOTES_INFO_CHUNK_SIZE) -> Iterator[Dict[str, Any]]:
+    """Yield note info in chunks, prefetching the next chunk while the current one is consumed.
+
+    Raises AnkiConnectionError if a chunk cannot be fetched.
+    """
+    chunks = [note_ids[i:i + chunk_size] for i in range(0, len(note_ids), chunk_size)]
+    if not chunks:
+        return
+    with ThreadPoolExecutor(max_workers=1) as prefetcher:
+        future = prefetcher.submit(anki.invoke, "notesInfo", notes=chunks[0])
+        for next_chunk in chunks[1:] + [None]:
+            notes = future.result()
+            if notes is None:
+                # Silently skipping the chunk would leave its notes unsynced and uncounted
+                raise AnkiConnectionError("notesInfo failed; some matching notes could not be read from Anki")
+            if next_chunk is not None:
+                future = prefetcher.submit(anki.invoke, "notesInfo", notes=next_chunk)
+            yield from notes
+
+def build_tts_input(txt: str, voice: str, rate: str, pitch: str, ssml_source: bool = False) -> str:
+    """Return the text or SSML to send to Azure for a task's source text."""
+    # If source is already SSML, use it directly; otherwise wrap it
+    if ssml_source:
+        return txt
+    return wrap_ssml(txt, voice, rate=rate, pitch=pitch) if ("<br" in txt or rate != "1.0" or pitch != "0%") else txt
+
+def build_anki_actions(task: Tuple, audio: bytes) -> List[Dict[str, Any]]:
+    """Return the AnkiConnect actions that store a task's audio and link it from the target field."""
+    nid, s_fld, t_fld, _ = task
     fname = f"azv_{s_fld}_{nid}.mp3"
-    l_file = temp_path / fname
+    b64 = b64encode_as_string(audio)
+    return [
+        {"action": "storeMediaFile", "params": {"filename": fname, "data": b64}},
+        {"action": "updateNoteFields", "params": {"note": {"id": nid, "fields": {t_fld: f"[sound:{fname}]"}}}},
+    ]
+
+def process_single_task(task: Tuple, tts: AzureTTSManager,
+                        voice: str, rate: str, pitch: str, ssml_source: bool = False, debug: bool = False,
+                        cache: Optional[AudioCache] = None) -> Optional[List[Dict[str, Any]]]:
+    """Worker function for threading. Returns the AnkiConnect actions that store the audio, or None on failure."""
+    nid, s_fld, t_fld, txt = task
     
     if debug:
         click.secho(f"[DEBUG] Processing note {nid}: {s_fld} -> {t_fld}", fg="cyan")
     
-    # If source is already SSML, use it directly; otherwise wrap it
-    if ssml_source:
-        input_content = txt
-    else:
-        input_content = wrap_ssml(txt, voice, rate=rate, pitch=pitch) if ("<br" in txt or rate != "1.0" or pitch != "0%") else txt
+    input_content = build_tts_input(txt, voice, rate, pitch, ssml_source)
     
     if debug:
         click.secho(f"[DEBUG] Generated content length: {len(input_content)} chars", fg="cyan")
     
-    if tts.speak(input_content, l_file, debug=debug):
-        try:
-            with open(l_file, "rb") as f:
-                b64 = base64.b64encode(f.read()).decode("utf-8")
-            anki.invoke("storeMediaFile", filename=fname, data=b64)
-            anki.invoke("updateNoteFields", note={"id": nid, "fields": {t_fld: f"[sound:{fname}]"}})
-            if debug:
-                click.secho(f"[DEBUG] Successfully updated Anki note {nid}", fg="green")
-            return True
-        except Exception as e:
-            if debug:
-                click.secho(f"[DEBUG] Error updating Anki: {e}", fg="red")
-            return False
+    audio = cache.get(voice, input_content) if cache else None
+    if audio is not None:
+        if debug:
+            click.secho(f"[DEBUG] Cache hit for note {nid}", fg="cyan")
     else:
+        audio = tts.synthesize(input_content, debug=debug)
+        if audio is not None and cache:
+            cache.put(voice, input_content, audio)
+
+    if audio is None:
         if debug:
             click.secho(f"[DEBUG] Failed to synthesize audio for note {nid}", fg="red")
-    return False
+        return None
+
+    return build_anki_actions(task, audio)
+
+def sync_with_batch_api(tasks: List[Tuple], tts: AzureTTSManager, anki: AnkiClient,
+                        voice: str, rate: str, pitch: str, ssml_source: bool = False, debug: bool = False,
+                        cache: Optional[AudioCache] = None) -> int:
+    """Synthesize all tasks through Azure batch synthesis jobs, then update Anki. Returns the number of notes updated."""
+    inputs = [build_tts_input(task[3], voice, rate, pitch, ssml_source) for task in tasks]
+    audios = [cache.get(voice, content) if cache else None for content in inputs]
+    pending = [i for i, audio in enumerate(audios) if audio is None]
+
+    if pending:
+        # Batch jobs take a single input kind, so submit everything as SSML.
+        # Raw --ssml-source fields are plain text to Azure, so escape them like clean_html does.
+        ssml_docs = [
+            inputs[i] if inputs[i].strip().startswith("<speak")
+            else wrap_ssml(html.escape(inputs[i], quote=False) if ssml_source else inputs[i], voice)
+            for i in pending
+        ]
+        click.echo(f"Submitting {len(pending)} inputs to Azure batch synthesis...")
+        for i, audio in zip(pending, tts.synthesize_batch(ssml_docs, debug=debug)):
+            audios[i] = audio
+            if audio is not None and cache:
+                cache.put(voice, inputs[i], audio)
+
+    with AnkiBatchWriter(anki, debug) as writer:
+        for task, audio in tqdm(list(zip(tasks, audios)), desc="Syncing", **PROGRESS_OPTIONS):
+            if audio is None:
+                if debug:
+                    click.secho(f"[DEBUG] Failed to synthesize audio for note {task[0]}", fg="red")
+                continue
+            writer.add(task, build_anki_actions(task, audio))
+        return writer.finish()
+
+def flush_anki_batch(anki: AnkiClient, batch: List[Tuple[Tuple, List[Dict[str, Any]]]], debug: bool = False) -> int:
+    """Send queued note updates to Anki in one 'multi' request. Returns the number of notes updated."""
+    if not batch:
+        return 0
+    actions = [action for _, task_actions in batch for action in task_actions]
+    errors = iter(anki.invoke_multi(actions))
+    succeeded = 0
+    for task, task_actions in batch:
+        nid, s_fld, t_fld, _ = task
+        task_errors = [e for e in (next(errors, "missing result") for _ in task_actions) if e]
+        if task_errors:
+            click.secho(f"Error: Failed to update note {nid} ({s_fld} -> {t_fld}): {task_errors[0]}", fg="red")
+            continue
+        succeeded += 1
+        if debug:
+            click.secho(f"[DEBUG] Successfully updated Anki note {nid}", fg="green")
+    batch.clear()
+    return succeeded
+
+class AnkiBatchWriter:
+    """Queue note updates and send them to Anki as 'multi' batches on a background thread."""
+
+    def __init__(self, anki: AnkiClient, debug: bool = False, batch_size: int = ANKI_BATCH_SIZE):
+        self.anki = anki
+        self.debug = debug
+        self.batch_size = batch_size
+        self.succeeded = 0
+        self._batch: List[Tuple[Tuple, List[Dict[str, Any]]]] = []
+        self._pending = None
+        self._executor = ThreadPoolExecutor(max_workers=1)
+
+    def add(self, task: Tuple, actions: List[Dict[str, Any]]):
+        self._batch.append((task, actions))
+        if len(self._batch) >= self.batch_size:
+            self._submit()
+
+    def finish(self) -> int:
+        """Flush everything still queued and return the number of notes updated."""
+        if self._batch:
+            self._submit()
+        self._collect()
+        return self.succeeded
+
+    def _submit(self):
+        # Anki handles requests one at a time, so wait for the previous flush first
+        self._collect()
+        self._pending = self._executor.submit(flush_anki_batch, self.anki, self._batch, self.debug)
+        self._batch = []
+
+    def _collect(self):
+        if self._pending is not None:
+            pending, self._pending = self._pending, None
+            self.succeeded += pending.result()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self._executor.shutdown(wait=True, cancel_futures=True)
 
 # --- CLI Command Group ---
 
@@ -325,16 +784,18 @@ def sample(config, voice, locale, text, rate, pitch, out_dir, play):
 @click.option("--rate", default="1.0", help="Speech rate")
 @click.option("--pitch", default="0%", help="Pitch adjustment")
 @click.option("--overwrite", is_flag=True, default=False, help="Overwrite existing audio")
-@click.option("--workers", "-w", default=1, type=int, help="Number of concurrent workers")
+@click.option("--workers", "-w", default=DEFAULT_WORKERS, type=int, help="Number of concurrent workers")
 @click.option("--yes", "-y", is_flag=True, default=False, help="Skip confirmation")
 @click.option("--ssml-source", is_flag=True, default=False, help="Source field is in SSML format")
+@click.option("--batch", "use_batch", is_flag=True, default=False, help=f"Use Azure batch synthesis for jobs over {BATCH_MIN_TASKS} files")
+@click.option("--no-cache", is_flag=True, default=False, help="Always re-synthesize, bypassing the audio cache")
 @click.option("--debug", is_flag=True, default=False, help="Enable debug mode")
-def sync(config, query, source, target, fields, voice, rate, pitch, overwrite, workers, yes, ssml_source, debug):
+def sync(config, query, source, target, fields, voice, rate, pitch, overwrite, workers, yes, ssml_source, use_batch, no_cache, debug):
     """Sync Anki notes with multi-threading and detailed stats."""
     if debug:
         click.secho("[DEBUG] Debug mode enabled", fg="blue")
     cfg = load_config(config)
-    anki = AnkiClient(cfg.get("ANKI_CONNECT_URL"))
+    workers = max(workers, 1)
     
     field_map = parse_field_mapping(fields) if fields else {}
     if source and target: field_map[source] = target
@@ -350,23 +811,59 @@ def sync(config, query, source, target, fields, voice, rate, pitch, overwrite, w
         return
 
     tts = AzureTTSManager(tts_key, tts_region, default_voice)
-    temp_path = Path("temp_audios")
+    cache = None
+    if not no_cache:
+        # The cache is an optimization; an unusable cache directory shouldn't stop the sync
+        try:
+            cache = AudioCache()
+            evicted = cache.evict_expired()
+            if debug and evicted:
+                click.secho(f"[DEBUG] Evicted {evicted} expired cache entries", fg="blue")
+        except (OSError, sqlite3.Error) as e:
+            click.secho(f"Warning: Audio cache unavailable, continuing without it. ({e})", fg="yellow")
+            if cache: cache.close()
+            cache = None
     
+    anki = AnkiClient(cfg.get("ANKI_CONNECT_URL"), pool_size=workers)
     try:
         click.echo(f"Searching: {query}...")
         note_ids = anki.invoke("findNotes", query=query)
+        if note_ids is None:
+            raise click.ClickException(f"findNotes failed for query: {query}")
         if not note_ids: return
-        notes_data = anki.invoke("notesInfo", notes=note_ids)
+        if not overwrite:
+            # Let Anki skip notes whose target fields are already filled, so their data is never fetched.
+            # Anki's "field:" search only matches truly empty fields, so whitespace-only targets count as filled.
+            filtered_ids = anki.invoke("findNotes", query=build_missing_audio_query(query, list(dict.fromkeys(field_map.values()))))
+            if filtered_ids is None:
+                # The search failed; filter client-side instead
+                if debug:
+                    click.secho("[DEBUG] Empty-field pre-filter failed, checking all notes", fg="blue")
+            else:
+                click.echo(f"Skipping {len(note_ids) - len(filtered_ids)} of {len(note_ids)} notes that already have audio.")
+                if not filtered_ids:
+                    click.secho("No notes require sync.", fg="yellow")
+                    return
+                note_ids = filtered_ids
         
         tasks = []
         total_chars = 0
-        for note in notes_data:
+        for note in tqdm(iter_notes_info(anki, note_ids), total=len(note_ids), desc="Scanning", **PROGRESS_OPTIONS):
             note_fields = note.get("fields", {})
             for src, tgt in field_map.items():
                 if src in note_fields and tgt in note_fields:
                     if note_fields.get(tgt, {}).get("value", "").strip() and not overwrite: continue
                     raw_txt = note_fields.get(src, {}).get("value", "")
+                    if not has_speakable_text(raw_txt): continue
                     txt = raw_txt if ssml_source else clean_html(raw_txt)
+                    # Truncating SSML would break its markup, so only plain text is capped
+                    if not ssml_source and len(txt) > MAX_TTS_CHARS:
+                        click.secho(
+                            f"Warning: note {note['noteId']} field '{src}' has {len(txt):,} characters; "
+                            f"truncating to {MAX_TTS_CHARS:,}.",
+                            fg="yellow",
+                        )
+                        txt = truncate_for_tts(txt)
                     if txt: 
                         tasks.append((note["noteId"], src, tgt, txt))
                         total_chars += len(txt)
@@ -375,30 +872,66 @@ def sync(config, query, source, target, fields, voice, rate, pitch, overwrite, w
             click.secho("No notes require sync.", fg="yellow")
             return
 
+        # Batch jobs have a fixed startup cost, so small syncs stay on the streaming API
+        batch_mode = use_batch and len(tasks) >= BATCH_MIN_TASKS
+        if batch_mode and not default_voice:
+            click.secho("Warning: --batch requires a voice; falling back to streaming synthesis.", fg="yellow")
+            batch_mode = False
+
         click.secho(f"\n--- Sync Statistics ---", fg="cyan", bold=True)
         click.echo(f"Total Audio Files: {len(tasks)}")
         click.echo(f"Total Characters:  {total_chars:,}")
-        click.echo(f"Concurrent Workers: {workers}")
+        if batch_mode:
+            click.echo("Synthesis Mode:    Azure batch")
+        else:
+            click.echo(f"Concurrent Workers: {workers}")
         click.echo(f"Voice:             {default_voice}")
         
         if not yes:
             click.echo("")
             if not click.confirm("Proceed?"): return
 
-        temp_path.mkdir(exist_ok=True)
         if debug:
             click.secho(f"[DEBUG] Starting sync with {len(tasks)} tasks", fg="blue")
-        with ThreadPoolExecutor(max_workers=workers) as executor:
-            future_to_task = {
-                executor.submit(process_single_task, task, tts, anki, temp_path, default_voice, rate, pitch, ssml_source, debug): task 
-                for task in tasks
-            }
-            for _ in tqdm(as_completed(future_to_task), total=len(tasks), desc="Syncing"):
-                pass
-                
-        click.secho(f"\nDone! {len(tasks)} files processed.", fg="green")
+        if batch_mode:
+            succeeded = sync_with_batch_api(tasks, tts, anki, default_voice, rate, pitch, ssml_source, debug, cache)
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                future_to_task = {
+                    executor.submit(process_single_task, task, tts, default_voice, rate, pitch, ssml_source, debug, cache): task 
+                    for task in tasks
+                }
+                try:
+                    with AnkiBatchWriter(anki, debug) as writer, \
+                            tqdm(total=len(tasks), desc="Syncing", **PROGRESS_OPTIONS) as pbar:
+                        for future in as_completed(future_to_task):
+                            # Drop our reference so the base64 payload can be freed once it is sent
+                            task = future_to_task.pop(future)
+                            try:
+                                actions = future.result()
+                            except Exception as e:
+                                # One bad task (SDK error, cache I/O, ...) shouldn't abort the whole sync
+                                actions = None
+                                if debug:
+                                    click.secho(f"[DEBUG] Error processing note {task[0]}: {e}", fg="red")
+                            if actions:
+                                writer.add(task, actions)
+                            pbar.update(1)
+                        succeeded = writer.finish()
+                except AnkiConnectionError:
+                    # Don't keep paying for synthesis that can never be stored
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    raise
+
+        failed = len(tasks) - succeeded
+        click.secho(f"\nDone! {succeeded}/{len(tasks)} files processed.", fg="green" if not failed else "yellow")
+        if failed:
+            click.secho(f"{failed} files failed. Re-run with --debug for details.", fg="yellow")
+    except AnkiConnectionError as e:
+        raise click.ClickException(str(e))
     finally:
-        if temp_path.exists(): shutil.rmtree(temp_path)
+        anki.close()
+        if cache: cache.close()
 
 @cli.command()
 @click.option("--config", type=click.Path(exists=True), help="Path to config")